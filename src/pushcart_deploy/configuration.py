@@ -7,7 +7,7 @@ with a CSV file for transformation definitions.
 Example:
 -------
     config_dict = json.load(file)
-    pipeline_config = Configuration.parse_obj(config_dict)
+    pipeline_config = Configuration.model_validate(config_dict)
 
 Notes:
 -----
@@ -16,29 +16,59 @@ data pipeline defined.
 
 """
 
-import json
+import asyncio
 import logging
 import os
 from collections import defaultdict
-from collections.abc import AsyncIterator
-from io import StringIO
-from itertools import groupby
+from collections.abc import AsyncIterator, Iterable
+from functools import cache
+from itertools import chain
 from pathlib import Path
+from typing import Annotated, Literal
 
-import aiofiles
+import orjson
 import pandas as pd
-import tomli
-import yaml
 from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
     Field,
+    StrictStr,
+    StringConstraints,
+    TypeAdapter,
     conint,
-    constr,
-    dataclasses,
     field_validator,
     model_validator,
-    validate_call,
 )
-from pydantic_core._pydantic_core import ArgsKwargs
+
+log = logging.getLogger(__name__)
+
+
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1, strict=True)]
+StrippedNonEmptyStr = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, min_length=1, strict=True),
+]
+ColumnType = Literal[
+    "string",
+    "int",
+    "double",
+    "date",
+    "timestamp",
+    "boolean",
+    "struct",
+    "array",
+    "map",
+]
+DestinationMode = Literal["append", "upsert"]
+ValidationAction = Annotated[
+    Literal["LOG", "DROP", "FAIL"],
+    BeforeValidator(lambda v: v.upper() if isinstance(v, str) else v),
+]
+
+_SETTINGS_PATH_ADAPTER = TypeAdapter(Path)
+
+_CSV_CHUNK_SIZE = 1000
 
 
 async def get_transformations_from_csv(csv_path: Path | str) -> AsyncIterator[dict]:
@@ -74,15 +104,19 @@ async def get_transformations_from_csv(csv_path: Path | str) -> AsyncIterator[di
         "validation_action": str,
     }
 
-    async with aiofiles.open(csv_path, "r") as aio_file:
-        contents = await aio_file.read()
-        csv_file = StringIO(contents)
-
-        csv_df = pd.read_csv(csv_file, dtype=types_dict).fillna("")
-        csv_dict = csv_df.to_dict(orient="records")
+    csv_reader = await asyncio.to_thread(
+        pd.read_csv,
+        csv_path,
+        dtype=types_dict,
+        encoding="utf-8",
+        chunksize=_CSV_CHUNK_SIZE,
+    )
 
-        for row in csv_dict:
-            yield row
+    with csv_reader:
+        while (csv_df := await asyncio.to_thread(next, csv_reader, None)) is not None:
+            columns = tuple(csv_df.columns)
+            for values in csv_df.fillna("").itertuples(index=False, name=None):
+                yield dict(zip(columns, values, strict=True))
 
 
 async def get_transformations_from_sql(sql_path: Path | str) -> str:
@@ -98,8 +132,50 @@ async def get_transformations_from_sql(sql_path: Path | str) -> str:
     str
         SQL string from input file
     """
-    async with aiofiles.open(sql_path, "r") as sql_file:
-        return await sql_file.read()
+    if isinstance(sql_path, str):
+        sql_path = Path(sql_path)
+
+    return await asyncio.to_thread(sql_path.read_text, encoding="utf-8")
+
+
+def _load_json(contents: bytes) -> dict | list:
+    return orjson.loads(contents)
+
+
+def _load_toml(contents: bytes) -> dict:
+    try:
+        import tomllib
+    except ModuleNotFoundError:
+        import tomli as tomllib
+
+    return tomllib.loads(contents.decode("utf-8"))
+
+
+@cache
+def _get_yaml_loader() -> type:
+    try:
+        from yaml import CSafeLoader as YamlSafeLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlSafeLoader
+
+    return YamlSafeLoader
+
+
+def _load_yaml(contents: bytes) -> dict | list | None:
+    import yaml
+
+    try:
+        return yaml.load(contents, Loader=_get_yaml_loader())  # noqa: S506
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+
+_LOADERS = {
+    ".json": _load_json,
+    ".toml": _load_toml,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+}
 
 
 def expect_at_most_one_file(settings_path: Path | str) -> Path | None:
@@ -142,7 +218,6 @@ def expect_at_most_one_file(settings_path: Path | str) -> Path | None:
     return existing_paths[0]
 
 
-@validate_call
 async def get_config_from_file(settings_path: Path | str) -> dict | None:
     """Load a configuration file into a dictionary. Supported formats are JSON, YAML, and TOML.
 
@@ -156,55 +231,30 @@ async def get_config_from_file(settings_path: Path | str) -> dict | None:
     dict | None
         The configuration data as a dictionary, or None if an error occurred.
     """
-    loaders = defaultdict(
-        lambda: None,
-        {
-            ".json": json.loads,
-            ".toml": tomli.loads,
-            ".yaml": yaml.safe_load,
-            ".yml": yaml.safe_load,
-        },
-    )
+    settings_path = _SETTINGS_PATH_ADAPTER.validate_python(settings_path)
 
-    log = logging.getLogger(__name__)
+    if not settings_path.exists():
+        return None
 
-    try:
-        if isinstance(settings_path, str):
-            settings_path = Path(settings_path)
-
-        if settings_path.exists():
-            ext = settings_path.suffix
-            async with aiofiles.open(settings_path, "r") as settings_file:
-                contents = await settings_file.read()
-
-                return loaders[ext](contents)
-    except FileNotFoundError:
-        log.warning(f"File not found: {settings_path.as_posix()}")
-    except OSError:
-        log.warning(f"Could not open file: {settings_path.as_posix()}")
-    except (json.JSONDecodeError, yaml.error.YAMLError, tomli.TOMLDecodeError):
-        log.warning(f"File is not valid: {settings_path.as_posix()}")
-    except TypeError:
+    if (loader := _LOADERS.get(settings_path.suffix)) is None:
         log.warning(f"Unsupported file type: {settings_path.as_posix()}")
-    except RuntimeError as e:
-        log.warning(f"Skipping: {settings_path.as_posix()} Encountered: {e}")
+        return None
 
+    try:
+        contents = await asyncio.to_thread(settings_path.read_bytes)
+        return loader(contents)
+    except (ValueError, OSError, RecursionError) as e:
+        log.warning(f"Could not load file: {settings_path.as_posix()} Encountered: {e}")
+        return None
 
-def _get_multiple_validations_with_same_rule(validations: dict) -> dict:
-    """Group a list of validations by their rule and return only the groups that have more than one validation with the same rule."""
-    validation_groups = {
-        k: [v["validation_action"] for v in v]
-        for k, v in groupby(
-            sorted(validations, key=lambda v: str(v["validation_rule"]).strip()),
-            lambda r: str(r["validation_rule"]).strip(),
-        )
-    }
 
-    return {k: v for k, v in validation_groups.items() if len(v) > 1}
+class _PipelineModel(BaseModel):
+    """Immutable base for pipeline stage definitions, ignoring unknown fields."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
-@dataclasses.dataclass
-class Validation:
+class Validation(_PipelineModel):
     """Provides a way to define validation rules and actions for data.
 
     Has two main fields: validation_rule and validation_action. The validation_rule
@@ -213,31 +263,28 @@ class Validation:
     the input data fails to meet the validation rule.
     """
 
-    validation_rule: constr(min_length=1, strict=True)
-    validation_action: constr(
-        to_upper=True,
-        strict=True,
-        pattern=r"^(LOG|DROP|FAIL)$",
-    )
+    validation_rule: NonEmptyStr
+    validation_action: ValidationAction
 
-    def __getitem__(self, item: str) -> any:
-        """Avoid Pydantic throwing ValidationError: object not subscriptable.
 
-        Parameters
-        ----------
-        item : str
-            Name of parent object attribute
+def _get_multiple_validations_with_same_rule(
+    validations: Iterable[Validation | dict],
+) -> dict:
+    """Group a list of validations by their rule and return only the groups that have more than one validation with the same rule."""
+    validation_groups = defaultdict(list)
+
+    for v in validations:
+        if isinstance(v, Validation):
+            rule, action = v.validation_rule, v.validation_action
+        else:
+            rule, action = v["validation_rule"], v["validation_action"]
 
-        Returns
-        -------
-        any
-            Type of returned object
-        """
-        return self.__getattribute__(item)
+        validation_groups[str(rule).strip()].append(action)
 
+    return {k: v for k, v in validation_groups.items() if len(v) > 1}
 
-@dataclasses.dataclass
-class Source:
+
+class Source(_PipelineModel):
     """Represents a data source and its associated metadata.
 
     Handles different types of data sources, including local files, remote URLs, and
@@ -256,13 +303,13 @@ class Source:
         validation rule
     """
 
-    target_catalog_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    target_schema_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    pipeline_name: constr(strip_whitespace=True, min_length=1, strict=True)
+    target_catalog_name: StrippedNonEmptyStr
+    target_schema_name: StrippedNonEmptyStr
+    pipeline_name: StrippedNonEmptyStr
 
-    origin: constr(min_length=1, strict=True)
-    datatype: constr(min_length=1, strict=True)
-    target: constr(min_length=1, strict=True)
+    origin: NonEmptyStr
+    datatype: NonEmptyStr
+    target: NonEmptyStr
     params: str | None = None
     validations: list[Validation] | None = Field(default_factory=list)
 
@@ -276,8 +323,7 @@ class Source:
         return value
 
 
-@dataclasses.dataclass
-class Transformation:
+class Transformation(_PipelineModel):
     """Represents a data transformation with optional validation rules.
 
     It ensures that only one of the config or sql_query fields is defined and that at
@@ -300,43 +346,36 @@ class Transformation:
         validation rule
     """
 
-    target_catalog_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    target_schema_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    pipeline_name: constr(strip_whitespace=True, min_length=1, strict=True)
+    target_catalog_name: StrippedNonEmptyStr
+    target_schema_name: StrippedNonEmptyStr
+    pipeline_name: StrippedNonEmptyStr
 
-    origin: constr(min_length=1, strict=True)
-    target: constr(min_length=1, strict=True)
+    origin: NonEmptyStr
+    target: NonEmptyStr
     column_order: conint(ge=1) | None = 1
-    source_column_name: constr(strict=True) | None = None
-    source_column_type: constr(
-        strict=True,
-        pattern="^(string|int|double|date|timestamp|boolean|struct|array|map)$",
-    ) | None = None
-    dest_column_name: constr(strict=True) | None = None
-    dest_column_type: constr(
-        strict=True,
-        pattern="^(string|int|double|date|timestamp|boolean|struct|array|map)$",
-    ) | None = None
-    transform_function: constr(strict=True) | None = None
-    sql_query: constr(min_length=1, strict=True) | None = None
-    default_value: constr(strict=True) | None = None
+    source_column_name: StrictStr | None = None
+    source_column_type: ColumnType | None = None
+    dest_column_name: StrictStr | None = None
+    dest_column_type: ColumnType | None = None
+    transform_function: StrictStr | None = None
+    sql_query: NonEmptyStr | None = None
+    default_value: StrictStr | None = None
     validations: list[Validation] | None = Field(default_factory=list)
 
     @model_validator(mode="before")
     @classmethod
     def check_only_one_of_config_or_sql_query_defined(cls, values: dict) -> dict:
         """Check that one and only one of the config or sql_query fields is defined."""
-        data = values.kwargs if isinstance(values, ArgsKwargs) else values
         if not any(
-            data.get(v) is not None
+            values.get(v) is not None
             for v in ["source_column_name", "dest_column_name", "sql_query"]
         ):
-            msg = f"No transformation defined. Please provide either a config or a sql_query.\nGot: {data}"
+            msg = f"No transformation defined. Please provide either a config or a sql_query.\nGot: {values}"
             raise ValueError(msg)
         if all(
-            data.get(t) for t in ["source_column_name", "dest_column_name", "sql_query"]
+            values.get(t) for t in ["source_column_name", "dest_column_name", "sql_query"]
         ):
-            msg = f"Only one of config or sql_query allowed.\nGot: {data}"
+            msg = f"Only one of config or sql_query allowed.\nGot: {values}"
             raise ValueError(msg)
         return values
 
@@ -350,8 +389,7 @@ class Transformation:
         return value
 
 
-@dataclasses.dataclass
-class Destination:
+class Destination(_PipelineModel):
     """Represents a Delta table destination for a batch of data.
 
     Defines fields for the source data view, the destination table, the path to the
@@ -375,28 +413,26 @@ class Destination:
         validation rule
     """
 
-    target_catalog_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    target_schema_name: constr(strip_whitespace=True, min_length=1, strict=True)
-    pipeline_name: constr(strip_whitespace=True, min_length=1, strict=True)
+    target_catalog_name: StrippedNonEmptyStr
+    target_schema_name: StrippedNonEmptyStr
+    pipeline_name: StrippedNonEmptyStr
 
-    origin: constr(min_length=1, strict=True)
-    target: constr(min_length=1, strict=True)
-    mode: constr(min_length=1, strict=True, pattern=r"^(append|upsert)$")
+    origin: NonEmptyStr
+    target: NonEmptyStr
+    mode: DestinationMode
     path: Path | None = None
-    keys: list[constr(min_length=1, strict=True)] | None = Field(
+    keys: list[NonEmptyStr] | None = Field(
         default_factory=list,
     )
-    sequence_by: constr(min_length=1, strict=True) | None = None
+    sequence_by: NonEmptyStr | None = None
     validations: list[Validation] | None = Field(default_factory=list)
 
     @model_validator(mode="before")
     @classmethod
     def check_keys_and_sequence_for_upsert(cls, values: dict) -> dict:
         """Check that the keys and sequence_by fields are defined for upsert mode."""
-        data = values.kwargs if isinstance(values, ArgsKwargs) else values
-
-        if data.get("mode") == "upsert" and not all(
-            data[v] for v in ["keys", "sequence_by"]
+        if values.get("mode") == "upsert" and not all(
+            values[v] for v in ["keys", "sequence_by"]
         ):
             msg = "Mode upsert requires that keys and sequence_by are defined"
             raise ValueError(
@@ -423,8 +459,7 @@ class Destination:
         return None
 
 
-@dataclasses.dataclass
-class Configuration:
+class Configuration(_PipelineModel):
     """Represents a configuration file for a data pipeline.
 
     Returns
@@ -453,12 +488,10 @@ class Configuration:
         """Check that at least one of the sources, transformations, or destinations fields is defined in the configuration file."""
         msg = "No stage definition found. Please define at least one of: sources, transformations, destinations"
 
-        data = values.kwargs if isinstance(values, ArgsKwargs) else values
-
-        if not data:
+        if not values:
             raise ValueError(msg)
 
-        if not any(v in ["sources", "transformations", "destinations"] for v in data):
+        if not any(v in ["sources", "transformations", "destinations"] for v in values):
             raise ValueError(msg)
 
         return values
@@ -470,25 +503,28 @@ class Configuration:
         values: dict[str, list[any]],
     ) -> dict:
         """Check that no values of the "target" fields of "sources", "transformations" and "destinations", taken together, overlap."""
-        data = values.kwargs if isinstance(values, ArgsKwargs) else values
+        sources = (values or {}).get("sources", [])
+        transformations = (values or {}).get("transformations", [])
+        destinations = (values or {}).get("destinations", [])
 
-        sources = (data or {}).get("sources", [])
-        transformations = (data or {}).get("transformations", [])
-        destinations = (data or {}).get("destinations", [])
-
-        target_values = (
-            [source.get("target") for source in sources if source]
-            + [
+        target_values = chain(
+            (source.get("target") for source in sources if source),
+            (
                 transformation.get("target")
                 for transformation in transformations
                 if transformation and transformation.get("sql_query")
-            ]
-            + [destination.get("target") for destination in destinations if destination]
+            ),
+            (destination.get("target") for destination in destinations if destination),
         )
 
-        duplicates = [
-            value for value in set(target_values) if target_values.count(value) > 1
-        ]
+        seen = set()
+        duplicates = {}
+
+        for target in target_values:
+            if target in seen:
+                duplicates[target] = None
+            else:
+                seen.add(target)
 
         if duplicates:
             msg = f"Duplicate 'target' values found: {', '.join(duplicates)}"
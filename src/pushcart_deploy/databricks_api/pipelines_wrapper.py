@@ -19,6 +19,7 @@ environment.
 
 """
 import logging
+from functools import cached_property
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.dbutils import RemoteDbUtils
@@ -77,12 +78,26 @@ class PipelinesWrapper:
         -------
         str
             Pipeline ID
+
+        Notes
+        -----
+        Pipeline names are looked up in a mapping built on first use, which is kept up
+        to date as this wrapper creates and deletes pipelines.
         """
-        pipelines_filtered = {
-            p["name"]: p["pipeline_id"] for p in self.get_pipelines_list()
-        }
+        return self._pipeline_ids_by_name.get(pipeline_name)
+
+    @cached_property
+    def _pipeline_ids_by_name(self) -> dict:
+        return {p["name"]: p["pipeline_id"] for p in self.get_pipelines_list()}
+
+    def _cache_pipeline_id(self, pipeline_name: str, pipeline_id: str) -> None:
+        if (pipeline_ids := self.__dict__.get("_pipeline_ids_by_name")) is not None:
+            pipeline_ids[pipeline_name] = pipeline_id
 
-        return pipelines_filtered.get(pipeline_name)
+    def _uncache_pipeline_id(self, pipeline_id: str) -> None:
+        if (pipeline_ids := self.__dict__.get("_pipeline_ids_by_name")) is not None:
+            for name in [k for k, v in pipeline_ids.items() if v == pipeline_id]:
+                del pipeline_ids[name]
 
     @validate_call
     def create_pipeline(self, pipeline_settings: dict, repo_path: str) -> str:
@@ -106,6 +121,7 @@ class PipelinesWrapper:
             repo_path,
             allow_duplicate_names=False,
         )
+        self._cache_pipeline_id(pipeline_settings["name"], pipeline["pipeline_id"])
 
         self.log.info(
             f"Created pipeline {pipeline_settings['name']} with ID: {pipeline['pipeline_id']}",
@@ -150,4 +166,5 @@ class PipelinesWrapper:
         """
         self.pipelines_api.delete(pipeline_id=pipeline_id)
         self.dbutils.fs.rm(f"dbfs:/pipelines/{pipeline_id}", recurse=True)
+        self._uncache_pipeline_id(pipeline_id)
         self.log.info(f"Deleted pipeline {pipeline_id}")
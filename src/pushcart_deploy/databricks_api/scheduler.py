@@ -27,6 +27,8 @@ class Scheduler:
         self.log = logging.getLogger(__name__)
         self.jobs_wrapper = JobsWrapper(self.api_client)
         self.pipelines_wrapper = PipelinesWrapper(self.api_client, self.config_dir)
+        self.pipeline_settings = PipelineSettings(self.api_client, self.config_dir)
+        self.job_settings = JobSettings(self.config_dir)
         self.repos_api = ReposApi(self.api_client)
 
     @validate_call
@@ -203,6 +205,9 @@ class Scheduler:
                 "pipeline_id": pipeline_id,
             }, ...]
         """
+        if not metadata_pipelines:
+            return []
+
         pipelines = []
         repo_path = self.repos_api.get(str(repo_id))["path"]
 
@@ -222,10 +227,7 @@ class Scheduler:
                     pipeline["name"],
                 )
 
-            pipeline_settings = PipelineSettings(
-                self.api_client,
-                self.config_dir,
-            ).load_pipeline_settings(
+            pipeline_settings = self.pipeline_settings.load_pipeline_settings(
                 target_catalog_name=pipeline["target_catalog_name"],
                 target_schema_name=pipeline["target_schema_name"],
                 pipeline_name=pipeline["name"],
@@ -283,7 +285,7 @@ class Scheduler:
         self.log.info("(Re)scheduling pipelines")
 
         for p in pipelines:
-            job_settings = JobSettings(self.config_dir).load_job_settings(
+            job_settings = self.job_settings.load_job_settings(
                 target_catalog_name=p["target_catalog_name"],
                 target_schema_name=p["target_schema_name"],
                 pipeline_name=p["name"],
@@ -323,7 +325,9 @@ class Scheduler:
                "pipeline_id": pipeline_id | None
             }, ...]
         """
-        for p in obsolete_pipelines:
-            for j in workflows_jobs:
-                if j["name"] == p["name"] or j["pipeline_id"] == p["pipeline_id"]:
-                    self.jobs_wrapper.delete_job(j["job_id"])
+        obsolete_names = {p["name"] for p in obsolete_pipelines}
+        obsolete_ids = {p["pipeline_id"] for p in obsolete_pipelines}
+
+        for j in workflows_jobs:
+            if j["name"] in obsolete_names or j["pipeline_id"] in obsolete_ids:
+                self.jobs_wrapper.delete_job(j["job_id"])
@@ -17,13 +17,29 @@ environment.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated
 
 from databricks_cli.sdk.api_client import ApiClient
 from databricks_cli.secrets.api import SecretApi
-from pydantic import Field, constr, dataclasses, validate_call
+from pydantic import Field, StringConstraints, dataclasses, validate_call
 
 from pushcart_deploy.validation import PydanticArbitraryTypesConfig
 
+SecretName = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        strict=True,
+        min_length=1,
+        pattern=r"^[A-Za-z0-9\-_.]{1,128}$",
+    ),
+]
+
+# Upper bound on concurrent put_secret requests made by a single push_secrets call
+_MAX_PUT_SECRET_WORKERS = 8
+
 
 @dataclasses.dataclass(config=PydanticArbitraryTypesConfig)
 class SecretsWrapper:
@@ -44,13 +60,7 @@ class SecretsWrapper:
     @validate_call
     def create_scope_if_not_exists(
         self,
-        secret_scope_name: constr(
-            strip_whitespace=True,
-            to_lower=True,
-            strict=True,
-            min_length=1,
-            pattern=r"^[A-Za-z0-9\-_.]{1,128}$",
-        ) = "pushcart",  # noqa: S107
+        secret_scope_name: SecretName = "pushcart",  # noqa: S107
     ) -> None:
         """Create a secret scope if it does not exist in the workspace."""
         scopes = self.secrets_api.list_scopes()["scopes"]
@@ -66,23 +76,8 @@ class SecretsWrapper:
     @validate_call
     def push_secrets(
         self,
-        secret_scope_name: constr(
-            strip_whitespace=True,
-            to_lower=True,
-            strict=True,
-            min_length=1,
-            pattern=r"^[A-Za-z0-9\-_.]{1,128}$",
-        ) = "pushcart",  # noqa: S107
-        secrets_dict: dict[
-            constr(
-                strip_whitespace=True,
-                to_lower=True,
-                strict=True,
-                min_length=1,
-                pattern=r"^[A-Za-z0-9\-_.]{1,128}$",
-            ),
-            str,
-        ] = Field(  # noqa: B008
+        secret_scope_name: SecretName = "pushcart",  # noqa: S107
+        secrets_dict: dict[SecretName, str] = Field(  # noqa: B008
             default_factory=dict,
         ),
     ) -> None:
@@ -93,6 +88,17 @@ class SecretsWrapper:
 
         self.create_scope_if_not_exists(secret_scope_name)
 
-        for key, value in secrets_dict.items():
-            self.secrets_api.put_secret(secret_scope_name, key, value, bytes_value=None)
-            self.log.info(f"Put secret '{key}' in '{secret_scope_name}' secret scope.")
+        with ThreadPoolExecutor(
+            max_workers=min(len(secrets_dict), _MAX_PUT_SECRET_WORKERS),
+        ) as executor:
+            futures = [
+                executor.submit(self._put_secret, secret_scope_name, key, value)
+                for key, value in secrets_dict.items()
+            ]
+
+            for future in futures:
+                future.result()
+
+    def _put_secret(self, secret_scope_name: str, key: str, value: str) -> None:
+        self.secrets_api.put_secret(secret_scope_name, key, value, bytes_value=None)
+        self.log.info(f"Put secret '{key}' in '{secret_scope_name}' secret scope.")
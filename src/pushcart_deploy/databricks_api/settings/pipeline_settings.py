@@ -41,28 +41,25 @@ class PipelineSettings:
         str
             String containing the smallest cluster node type available in current cloud
         """
-        node_types = [
-            t
-            for t in self.cluster_api.list_node_types()["node_types"]
-            if all(
-                [
-                    not t["is_deprecated"],
-                    not t["is_hidden"],
-                    t["photon_driver_capable"],
-                    t["photon_worker_capable"],
-                ],
-            )
-        ]
-
-        if not node_types:
+        node_type = min(
+            (
+                t
+                for t in self.cluster_api.list_node_types()["node_types"]
+                if not t["is_deprecated"]
+                and not t["is_hidden"]
+                and t["photon_driver_capable"]
+                and t["photon_worker_capable"]
+            ),
+            key=operator.itemgetter("num_cores", "memory_mb", "num_gpus"),
+            default=None,
+        )
+
+        if node_type is None:
             msg = "No Photon-capable node type could be selected"
             self.log.error(msg)
             raise RuntimeError(msg)
 
-        node = sorted(
-            node_types,
-            key=operator.itemgetter("num_cores", "memory_mb", "num_gpus"),
-        )[0]["node_type_id"]
+        node = node_type["node_type_id"]
         self.log.info(f"Using node type ID: {node}")
 
         return node
@@ -13,14 +13,13 @@ Requires Databricks CLI to already be configured for your target Databricks envi
 """
 
 import asyncio
-import json
 import logging
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-from dataclasses import asdict
-from glob import glob
 from pathlib import Path
 
+import orjson
 from databricks.connect import DatabricksSession
 from pydantic import DirectoryPath, dataclasses
 
@@ -72,36 +71,37 @@ class Metadata:
                     item.update(metadata)
 
         if config.get("transformations"):
+            parent_dir = file_path_obj.parent.resolve()
+
             for transformation in config["transformations"]:
-                if (
-                    transformation.get("config")
-                    and not Path(transformation["config"]).is_file()
-                ):
-                    transformation["config"] = str(
-                        file_path_obj.parent.joinpath(
-                            Path(transformation["config"]),
-                        ).resolve(),
-                    )
+                if not transformation.get("config"):
+                    continue
+
+                config_path = Path(transformation["config"])
+                if not config_path.is_absolute() and not config_path.is_file():
+                    transformation["config"] = (parent_dir / config_path).as_posix()
 
         return config
 
-    async def _collect_pipeline_configs(self) -> list:
-        pipeline_files = []
+    def _get_pipeline_files(self) -> list[str]:
+        pipelines_dir = Path(self.config_dir, "pipelines")
 
-        for extension in ["*.json", "*.toml", "*.yaml", "*.yml"]:
-            pipeline_files.extend(
-                glob(f"{self.config_dir}/pipelines/**/[!_]{extension}", recursive=True),
+        return [
+            p.as_posix()
+            for p in pipelines_dir.rglob("*")
+            if p.suffix in {".json", ".toml", ".yaml", ".yml"}
+            and not any(
+                part.startswith(("_", "."))
+                for part in p.relative_to(pipelines_dir).parts
             )
-
-        pipeline_tasks = [self._load_pipeline_with_metadata(f) for f in pipeline_files]
-
-        return await asyncio.gather(*pipeline_tasks)
+            and p.is_file()
+        ]
 
     @staticmethod
     async def _enrich_sources_config(sources_config: list) -> None:
         for source_dict in sources_config:
             if isinstance(source_dict.get("params"), dict):
-                source_dict["params"] = json.dumps(source_dict.get("params", {}))
+                source_dict["params"] = orjson.dumps(source_dict["params"]).decode()
 
         return {"sources": sources_config}
 
@@ -123,14 +123,16 @@ class Metadata:
                 pipeline_name=transformation["pipeline_name"],
             )
 
-            if row.get("validation_rule") and row.get("validation_action"):
+            validation_rule = row.pop("validation_rule", None)
+            validation_action = row.pop("validation_action", None)
+
+            if validation_rule and validation_action:
                 row["validations"] = [
                     {
-                        "validation_rule": row["validation_rule"],
-                        "validation_action": row["validation_action"],
+                        "validation_rule": validation_rule,
+                        "validation_action": validation_action,
                     },
                 ]
-                del row["validation_rule"], row["validation_action"]
 
             yield row
 
@@ -148,36 +150,47 @@ class Metadata:
 
         return sql_transformation
 
+    async def _expand_transformation_config(self, transformation: dict) -> list:
+        if "config" not in transformation:
+            return [transformation]
+
+        if not transformation["config"]:
+            return []
+
+        config_path = Path(transformation["config"])
+        if config_path.suffix == ".csv":
+            return [
+                row
+                async for row in self._handle_csv_transformations(
+                    transformation,
+                    config_path,
+                )
+            ]
+        if config_path.suffix == ".sql":
+            return [await self._handle_sql_transformations(transformation, config_path)]
+
+        msg = "Transformation configurations can only be .csv or .sql files"
+        raise TypeError(msg)
+
     async def _enrich_transformations_config(
         self,
         transformations_config: list,
     ) -> None:
-        enriched_transformations = []
-
-        for t in transformations_config:
-            if t.get("config"):
-                config_path = Path(t["config"])
-                if config_path.suffix == ".csv":
-                    async for row in self._handle_csv_transformations(t, config_path):
-                        enriched_transformations.append(row)
-                elif config_path.suffix == ".sql":
-                    enriched_transformations.append(
-                        await self._handle_sql_transformations(t, config_path),
-                    )
-                else:
-                    msg = "Transformation configurations can only be .csv or .sql files"
-                    raise TypeError(msg)
+        expanded_transformations = await asyncio.gather(
+            *[self._expand_transformation_config(t) for t in transformations_config],
+        )
 
         return {
-            "transformations": [t for t in transformations_config if "config" not in t]
-            + enriched_transformations,
+            "transformations": [
+                t for transformations in expanded_transformations for t in transformations
+            ],
         }
 
     @staticmethod
     async def _enrich_destinations_config(destinations_config: list) -> None:
         return {"destinations": destinations_config}
 
-    async def _enrich_pipeline_configs(self, pipeline_configs: list) -> None:
+    async def _enrich_pipeline_config(self, pipeline_config: dict) -> list:
         enrichment_func = {
             "sources": self._enrich_sources_config,
             "transformations": self._enrich_transformations_config,
@@ -187,49 +200,77 @@ class Metadata:
         return await asyncio.gather(
             *[
                 enrichment_func[stage_name](stage_config)
-                for pipeline_config in pipeline_configs
                 for stage_name, stage_config in pipeline_config.items()
                 if stage_name in enrichment_func
             ],
         )
 
+    async def _load_and_enrich_pipeline_config(self, file_path: str) -> list:
+        pipeline_config = await self._load_pipeline_with_metadata(file_path)
+        if pipeline_config is None:
+            return []
+
+        return await self._enrich_pipeline_config(pipeline_config)
+
+    async def _collect_and_enrich_pipeline_configs(self) -> list:
+        enriched_pipeline_configs = await asyncio.gather(
+            *[
+                self._load_and_enrich_pipeline_config(f)
+                for f in self._get_pipeline_files()
+            ],
+        )
+
+        return [c for configs in enriched_pipeline_configs for c in configs]
+
     def _validate_pipeline_configs(self, pipeline_configs: list) -> None:
-        validated_pipeline_configs = []
+        return [Configuration(**pipeline_config) for pipeline_config in pipeline_configs]
 
-        for pipeline_config in pipeline_configs:
-            validated_pipeline_configs.append(Configuration(**pipeline_config))
+    def _write_metadata_table(
+        self,
+        spark: DatabricksSession,
+        stage_name: str,
+        stage_elements: list,
+    ) -> None:
+        stage_df = spark.createDataFrame(stage_elements)
+        stage_df.write.option("mergeSchema", "true").saveAsTable(
+            f"pushcart.{stage_name}",
+            format="delta",
+            mode="overwrite",
+        )
 
-        return validated_pipeline_configs
+        self.log.info(f"Wrote {stage_name} metadata table.")
 
     def _create_metadata_tables(self, pipeline_configs: list) -> None:
         spark = DatabricksSession.builder.getOrCreate()
 
         spark.sql("CREATE DATABASE IF NOT EXISTS pushcart")
 
-        for stage_name in ["sources", "destinations", "transformations"]:
-            stage_df = spark.createDataFrame(
-                sanitize_empty_objects(
-                    [
-                        stage_element
-                        for pipeline_config in pipeline_configs
-                        for stage_element in asdict(pipeline_config)[stage_name]
-                    ],
-                    drop_empty=True,
-                ),
-            )
-            stage_df.write.option("mergeSchema", "true").saveAsTable(
-                f"pushcart.{stage_name}",
-                format="delta",
-                mode="overwrite",
-            )
+        stages = {"sources": [], "destinations": [], "transformations": []}
 
-            self.log.info(f"Wrote {stage_name} metadata table.")
+        for pipeline_config in pipeline_configs:
+            for stage_name, stage_elements in stages.items():
+                stage_elements.extend(
+                    e.model_dump() for e in getattr(pipeline_config, stage_name) or []
+                )
+
+        with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+            futures = [
+                executor.submit(
+                    self._write_metadata_table,
+                    spark,
+                    stage_name,
+                    sanitize_empty_objects(stage_elements, drop_empty=True),
+                )
+                for stage_name, stage_elements in stages.items()
+            ]
+
+            for future in futures:
+                future.result()
 
     def create_backend_objects(self) -> None:
         """Create metadata tables holding pipeline stages."""
-        pipeline_configs = asyncio.run(self._collect_pipeline_configs())
         enriched_pipeline_configs = asyncio.run(
-            self._enrich_pipeline_configs(pipeline_configs),
+            self._collect_and_enrich_pipeline_configs(),
         )
         validated_pipeline_configs = self._validate_pipeline_configs(
             enriched_pipeline_configs,
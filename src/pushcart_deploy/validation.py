@@ -1,36 +1,96 @@
 """Classes and functions to validate Pushcart deployment parameters."""
 
+from collections.abc import Iterator
 from typing import Any
 
+from pydantic import ConfigDict
 
-class PydanticArbitraryTypesConfig:
-    """Pydantic configuration to allow type-checking on arbitrary class types."""
-
-    arbitrary_types_allowed = True
+# Pydantic configuration to allow type-checking on arbitrary class types
+PydanticArbitraryTypesConfig = ConfigDict(arbitrary_types_allowed=True)
 
 
 def _is_empty(obj: str | dict | list) -> bool:
-    return (
-        isinstance(obj, str)
-        and not obj.strip()
-        or isinstance(obj, dict)
-        and not any(obj.values())
-        and all(
-            not isinstance(n, bool) and not isinstance(n, int) for n in obj.values()
-        )
-        or isinstance(obj, list)
-        and not any(obj)
-        and all(not isinstance(n, bool) and not isinstance(n, int) for n in obj)
-    )
+    if obj is None or isinstance(obj, int | float):
+        return False
+
+    if isinstance(obj, str):
+        return not obj or obj.isspace()
+
+    if isinstance(obj, dict | list):
+        items = obj.values() if isinstance(obj, dict) else obj
+        return not any(n or isinstance(n, int) for n in items)
+
+    return False
+
+
+_CONTAINER_TYPES = {dict: dict, list: list}
+
+
+def _get_container_type(obj: Any) -> type | None:  # noqa: ANN401
+    if (container_type := _CONTAINER_TYPES.get(type(obj))) is not None:
+        return container_type
+    if isinstance(obj, dict):
+        return dict
+    if isinstance(obj, list):
+        return list
+    return None
+
+
+def _iter_container(
+    obj: dict | list,
+    container_type: type,
+) -> Iterator[tuple[str | None, Any]]:
+    if container_type is dict:
+        return ((str(k).replace(".", "_"), v) for k, v in obj.items())
+    return ((None, v) for v in obj)
+
+
+def _add_to_container(container: dict | list, key: str | None, value: Any) -> None:  # noqa: ANN401
+    if type(container) is dict:
+        container[key] = value
+    else:
+        container.append(value)
+
+
+def _sanitize_container(obj: dict | list, drop_empty: bool = False) -> dict | list:
+    container_type = _get_container_type(obj)
+    sanitized = container_type()
+    stack = [(_iter_container(obj, container_type), sanitized, id(obj))]
+    ancestors = {id(obj)}
+
+    while stack:
+        children, container, container_id = stack[-1]
+
+        for key, value in children:
+            if _is_empty(value):
+                if not drop_empty:
+                    _add_to_container(container, key, None)
+            elif (value_type := _get_container_type(value)) is not None:
+                if id(value) in ancestors:
+                    msg = "Cannot sanitize an object that contains a reference to itself"
+                    raise ValueError(msg)
+
+                child = value_type()
+                _add_to_container(container, key, child)
+                stack.append((_iter_container(value, value_type), child, id(value)))
+                ancestors.add(id(value))
+                break
+            elif value is not None or not drop_empty:
+                _add_to_container(container, key, value)
+        else:
+            stack.pop()
+            ancestors.discard(container_id)
+
+    return sanitized
 
 
 def _sanitize_object(obj: Any, drop_empty: bool = False) -> Any:  # noqa: ANN401
+    if obj is None or isinstance(obj, int | float):
+        return obj
     if _is_empty(obj):
         return None
-    if isinstance(obj, dict):
-        return sanitize_dict_fields(obj, drop_empty)
-    if isinstance(obj, list):
-        return sanitize_list_elements(obj, drop_empty)
+    if _get_container_type(obj) is not None:
+        return _sanitize_container(obj, drop_empty)
     return obj
 
 
@@ -52,10 +112,7 @@ def sanitize_list_elements(
     list[Any]
         Sanitized version of input list, with empty values turned to None or dropped
     """
-    elements = [_sanitize_object(v, drop_empty) for v in list_to_sanitize]
-    if drop_empty:
-        return [e for e in elements if e is not None]
-    return elements
+    return _sanitize_container(list_to_sanitize, drop_empty)
 
 
 def sanitize_dict_fields(
@@ -77,13 +134,7 @@ def sanitize_dict_fields(
         A sanitized version of the input dictionary, with empty values replaced by
         None or dropped if drop_empty is True.
     """
-    fields = {
-        str(k).replace(".", "_"): _sanitize_object(v, drop_empty)
-        for k, v in dict_to_sanitize.items()
-    }
-    if drop_empty:
-        return {k: v for k, v in fields.items() if v is not None}
-    return fields
+    return _sanitize_container(dict_to_sanitize, drop_empty)
 
 
 def sanitize_empty_objects(obj: dict | list, drop_empty: bool = False) -> dict | list:
@@ -105,6 +156,8 @@ def sanitize_empty_objects(obj: dict | list, drop_empty: bool = False) -> dict |
     ------
     TypeError
         Input object must be a dict or a list.
+    ValueError
+        Input object contains a reference to itself.
     """
     if obj is None:
         return None
@@ -1,8 +1,10 @@
 from pathlib import Path
 
 import pytest
+import yaml
 from pydantic_core._pydantic_core import ValidationError
 
+from pushcart_deploy import configuration
 from pushcart_deploy.configuration import (
     Configuration,
     Destination,
@@ -25,6 +27,16 @@ class TestValidation:
             assert validation.validation_action in ["LOG", "DROP", "FAIL"]
             assert isinstance(validation.validation_rule, str)
 
+    def test_validation_action_case_insensitive(self):
+        """Tests that the validation_action field is upper-cased before being checked
+        against the allowed values, and that unknown actions are rejected.
+        """
+        validation = Validation(validation_rule="test", validation_action="drop")
+        assert validation.validation_action == "DROP"
+
+        with pytest.raises(ValueError):
+            Validation(validation_rule="test", validation_action="WARN")
+
     def test_validation_rule_string(self):
         """Tests that the validation_rule field is a string."""
         with pytest.raises(ValueError) as e:
@@ -47,7 +59,7 @@ class TestGetConfigFromFile:
         )
         test_data = {"name": "", "timeout_seconds": 60}
 
-        mocker.patch("json.loads", return_value=test_data)
+        mocker.patch("orjson.loads", return_value=test_data)
 
         result = await get_config_from_file(test_file)
 
@@ -62,6 +74,37 @@ class TestGetConfigFromFile:
 
         assert result is None
 
+    @pytest.mark.asyncio()
+    async def test_get_config_from_file_invalid_contents(self, tmp_path):
+        """Tests that the function returns None when the file cannot be parsed."""
+        test_file = tmp_path / "invalid.json"
+        test_file.write_text("{not json")
+
+        result = await get_config_from_file(test_file)
+
+        assert result is None
+
+
+    @pytest.mark.asyncio()
+    async def test_get_config_from_file_deeply_nested_yaml(self, tmp_path, mocker):
+        """Tests that the function returns None when nesting exceeds the recursion limit."""
+        mocker.patch.object(
+            configuration, "_get_yaml_loader", return_value=yaml.SafeLoader
+        )
+        test_file = tmp_path / "nested.yaml"
+        test_file.write_text("[" * 5000 + "]" * 5000)
+
+        result = await get_config_from_file(test_file)
+
+        assert result is None
+
+    @pytest.mark.asyncio()
+    async def test_get_config_from_file_missing_unsupported_file(self, caplog):
+        """Tests that a missing file returns None without an unsupported type warning."""
+        result = await get_config_from_file(Path("missing_file.txt"))
+
+        assert result is None
+        assert "Unsupported file type" not in caplog.text
 
 class TestGetMultipleValidationsWithSameRule:
     def test_one_rule_multiple_validations(self):
@@ -613,3 +656,24 @@ class TestConfiguration:
             Configuration()
 
         assert "No stage definition found" in str(e.value)
+
+    def test_duplicate_targets_across_stages(self):
+        """Tests that a target reused by a source and a destination is reported once."""
+        stage = {
+            "target_catalog_name": "sample_catalog",
+            "target_schema_name": "sample_schema",
+            "pipeline_name": "sample_pipeline",
+            "origin": "path/to/data",
+            "target": "temp_table",
+        }
+
+        with pytest.raises(ValueError) as e:
+            Configuration(
+                sources=[{**stage, "datatype": "csv"}],
+                destinations=[
+                    {**stage, "mode": "append"},
+                    {**stage, "mode": "append"},
+                ],
+            )
+
+        assert "Duplicate 'target' values found: temp_table" in str(e.value)
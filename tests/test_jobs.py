@@ -6,7 +6,7 @@ from pushcart_deploy.databricks_api.jobs_wrapper import JobsWrapper
 from pushcart_deploy.databricks_api.settings import JobSettings
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_api_client():
     api_client = ApiClient(host="https://databricks.sample.com")
 
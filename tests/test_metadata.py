@@ -1,4 +1,5 @@
 import asyncio
+import json
 from pathlib import PosixPath
 
 import pytest
@@ -6,50 +7,113 @@ import pytest
 from pushcart_deploy.configuration import Configuration
 from pushcart_deploy.metadata import Metadata
 
+pytestmark = pytest.mark.xdist_group("metadata")
+
+
+@pytest.fixture(scope="module")
+def metadata():
+    return Metadata("./tests/data")
+
+
+@pytest.fixture(scope="module")
+def enriched_pipeline_configs(metadata):
+    return asyncio.run(metadata._collect_and_enrich_pipeline_configs())
+
 
 class TestMetadata:
-    @pytest.mark.asyncio
-    async def test_metadata_creation_with_valid_directory_path(self):
+    def test_metadata_creation_with_valid_directory_path(self, metadata):
         """Tests that a Metadata object is created successfully with a valid directory path."""
-        input_path = "./tests/data"
-        metadata = Metadata(input_path)
-
-        assert metadata.config_dir == PosixPath(input_path)
+        assert metadata.config_dir == PosixPath("./tests/data")
 
-    @pytest.mark.asyncio
-    async def test_pipeline_configs_loaded_and_parsed_successfully(self):
+    def test_pipeline_configs_loaded_and_parsed_successfully(self, metadata):
         """Tests that pipeline configuration files are loaded and parsed successfully."""
-        metadata = Metadata("./tests/data")
-        pipeline_configs = await metadata._collect_pipeline_configs()
+        pipeline_files = metadata._get_pipeline_files()
+        assert len(pipeline_files) == 1
 
-        assert len(pipeline_configs) == 1
+        pipeline_config = asyncio.run(
+            metadata._load_pipeline_with_metadata(pipeline_files[0])
+        )
+        assert pipeline_config["transformations"]
 
-    @pytest.mark.asyncio
-    async def test_pipeline_configs_enriched_successfully(self):
-        """Tests that enrichment functions are applied to pipeline configurations successfully."""
+    def test_pipeline_files_skip_hidden_and_underscore_paths(self, tmp_path):
+        """Tests that files inside hidden or underscore directories are not collected."""
+        schema_dir = tmp_path / "pipelines" / "sample_catalog" / "sample_schema"
+        for directory in ["sample_pipeline", ".ipynb_checkpoints", "_drafts"]:
+            (schema_dir / directory).mkdir(parents=True)
 
-        metadata = Metadata("./tests/data")
-        pipeline_configs = await metadata._collect_pipeline_configs()
-        enriched_pipeline_configs = await metadata._enrich_pipeline_configs(
-            pipeline_configs
-        )
+        (schema_dir / "sample_pipeline" / "pipeline.yaml").write_text("{}")
+        (schema_dir / "sample_pipeline" / "_job_settings.json").write_text("{}")
+        (schema_dir / ".ipynb_checkpoints" / "pipeline-checkpoint.yaml").write_text("{}")
+        (schema_dir / "_drafts" / "pipeline.yaml").write_text("{}")
 
+        assert Metadata(tmp_path)._get_pipeline_files() == [
+            (schema_dir / "sample_pipeline" / "pipeline.yaml").as_posix()
+        ]
+
+    def test_pipeline_configs_enriched_successfully(self, enriched_pipeline_configs):
+        """Tests that enrichment functions are applied to pipeline configurations successfully."""
         assert any(
-            [
-                "column_order" in t
-                for t in enriched_pipeline_configs[0]["transformations"]
-            ]
+            "column_order" in t
+            for t in enriched_pipeline_configs[0]["transformations"]
+        )
+
+    def test_pipeline_configs_enriched_one_dict_per_stage(
+        self, enriched_pipeline_configs
+    ):
+        """Tests that each stage of a pipeline is enriched into its own config."""
+        assert all(
+            len(c) == 1 and set(c) <= {"sources", "transformations", "destinations"}
+            for c in enriched_pipeline_configs
         )
 
-    def test_validated_pipeline_configs_created_successfully(self):
+    def test_validated_pipeline_configs_created_successfully(
+        self, metadata, enriched_pipeline_configs
+    ):
         """Tests that validated pipeline configurations are created successfully."""
-        metadata = Metadata("./tests/data")
-        pipeline_configs = asyncio.run(metadata._collect_pipeline_configs())
+        validated_pipeline_configs = metadata._validate_pipeline_configs(
+            enriched_pipeline_configs
+        )
+
+        assert isinstance(validated_pipeline_configs[0], Configuration)
+
+    def test_cross_stage_shared_target_accepted(self, tmp_path):
+        """Tests that a target shared by a source and a destination of the same pipeline
+        is accepted, since each stage is validated on its own.
+        """
+        pipeline_dir = (
+            tmp_path / "pipelines" / "sample_catalog" / "sample_schema" / "dup_pipeline"
+        )
+        pipeline_dir.mkdir(parents=True)
+        (pipeline_dir / "dup_pipeline.json").write_text(
+            json.dumps(
+                {
+                    "sources": [
+                        {
+                            "origin": "path/to/data",
+                            "datatype": "csv",
+                            "target": "temp_table",
+                        },
+                    ],
+                    "destinations": [
+                        {
+                            "origin": "temp_table_view",
+                            "target": "temp_table",
+                            "mode": "append",
+                        },
+                    ],
+                },
+            ),
+        )
+
+        metadata = Metadata(tmp_path)
         enriched_pipeline_configs = asyncio.run(
-            metadata._enrich_pipeline_configs(pipeline_configs)
+            metadata._collect_and_enrich_pipeline_configs()
         )
+
         validated_pipeline_configs = metadata._validate_pipeline_configs(
             enriched_pipeline_configs
         )
 
-        assert isinstance(validated_pipeline_configs[0], Configuration)
+        assert len(validated_pipeline_configs) == 2
+        assert validated_pipeline_configs[0].sources[0].target == "temp_table"
+        assert validated_pipeline_configs[1].destinations[0].target == "temp_table"
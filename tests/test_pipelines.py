@@ -1,5 +1,6 @@
 import pytest
 from databricks.sdk.dbutils import _FsUtil
+from databricks.sdk.service.pipelines import PipelineStateInfo
 from databricks_cli.clusters.api import ClusterApi
 from databricks_cli.pipelines.api import PipelinesApi
 from databricks_cli.sdk.api_client import ApiClient
@@ -8,13 +9,25 @@ from pushcart_deploy.databricks_api import PipelinesWrapper
 from pushcart_deploy.databricks_api.settings import PipelineSettings
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_api_client():
     api_client = ApiClient(host="https://databricks.sample.com")
 
     return api_client
 
 
+@pytest.fixture(scope="module")
+def shared_pipelines_wrapper(mock_api_client):
+    return PipelinesWrapper(api_client=mock_api_client, config_dir="./tests/data")
+
+
+@pytest.fixture
+def pipelines_wrapper(shared_pipelines_wrapper):
+    shared_pipelines_wrapper.__dict__.pop("_pipeline_ids_by_name", None)
+
+    return shared_pipelines_wrapper
+
+
 class TestPipelineSettings:
     def test_load_pipeline_settings_from_file(self, mock_api_client):
         """Tests that pipeline settings are loaded from file correctly."""
@@ -231,7 +244,7 @@ class TestPipelineWrapper:
         assert all(isinstance(p, dict) for p in pipelines_list)
         assert all("name" in p and "pipeline_id" in p for p in pipelines_list)
 
-    def test_get_pipeline_id_existing(self, mocker, mock_api_client):
+    def test_get_pipeline_id_existing(self, mocker, pipelines_wrapper):
         """Tests that the method returns the correct pipeline ID for an existing pipeline name."""
         mocker.patch.object(
             PipelinesWrapper,
@@ -242,13 +255,10 @@ class TestPipelineWrapper:
             ],
         )
 
-        pipelines_wrapper = PipelinesWrapper(
-            api_client=mock_api_client, config_dir="./tests/data"
-        )
         pipeline_id = pipelines_wrapper.get_pipeline_id("pipeline1")
         assert pipeline_id == "1234"
 
-    def test_get_pipeline_id_nonexistent(self, mocker, mock_api_client):
+    def test_get_pipeline_id_nonexistent(self, mocker, pipelines_wrapper):
         """Tests that the method returns None for a non-existent pipeline name."""
         mocker.patch.object(
             PipelinesWrapper,
@@ -259,13 +269,66 @@ class TestPipelineWrapper:
             ],
         )
 
-        pipelines_wrapper = PipelinesWrapper(
-            api_client=mock_api_client, config_dir="./tests/data"
-        )
         pipeline_id = pipelines_wrapper.get_pipeline_id("pipeline3")
         assert pipeline_id is None
 
-    def test_create_pipeline(self, mocker, mock_api_client):
+    def test_get_pipeline_id_lists_pipelines_once(self, mocker, pipelines_wrapper):
+        """Tests that lookups reuse the pipeline list, which tracks created and deleted pipelines."""
+        mock_list = mocker.patch.object(
+            PipelinesWrapper,
+            "get_pipelines_list",
+            return_value=[{"name": "pipeline1", "pipeline_id": "1234"}],
+        )
+        mocker.patch.object(
+            PipelinesApi,
+            "create",
+            return_value={"name": "pipeline2", "pipeline_id": "5678"},
+        )
+        mocker.patch.object(PipelinesApi, "delete", return_value=None)
+        mocker.patch.object(_FsUtil, "rm", return_value=None)
+
+        assert pipelines_wrapper.get_pipeline_id("pipeline2") is None
+
+        pipelines_wrapper.create_pipeline({"name": "pipeline2"}, "/path/to/repo")
+        assert pipelines_wrapper.get_pipeline_id("pipeline2") == "5678"
+
+        pipelines_wrapper.delete_pipeline("1234")
+        assert pipelines_wrapper.get_pipeline_id("pipeline1") is None
+
+        assert mock_list.call_count == 1
+
+    def test_deploy_several_pipelines_lists_pipelines_once(
+        self, mocker, pipelines_wrapper
+    ):
+        """Tests that deploying several pipelines lists the workspace pipelines only once."""
+        list_pipelines = mocker.patch.object(
+            pipelines_wrapper.workspace.pipelines,
+            "list_pipelines",
+            return_value=[
+                PipelineStateInfo(name="pipeline1", pipeline_id="1234"),
+                PipelineStateInfo(name="pipeline2", pipeline_id="5678"),
+            ],
+        )
+        mocker.patch.object(
+            PipelinesApi,
+            "create",
+            side_effect=[{"pipeline_id": "9012"}, {"pipeline_id": "3456"}],
+        )
+        mocker.patch.object(PipelinesApi, "edit")
+
+        for name in ["pipeline1", "pipeline3", "pipeline2", "pipeline4"]:
+            if pipeline_id := pipelines_wrapper.get_pipeline_id(name):
+                pipelines_wrapper.update_pipeline(
+                    {"id": pipeline_id, "name": name}, "/path/to/repo"
+                )
+            else:
+                pipelines_wrapper.create_pipeline({"name": name}, "/path/to/repo")
+
+        assert pipelines_wrapper.get_pipeline_id("pipeline3") == "9012"
+        assert pipelines_wrapper.get_pipeline_id("pipeline4") == "3456"
+        list_pipelines.assert_called_once()
+
+    def test_create_pipeline(self, mocker, pipelines_wrapper):
         """Tests that the method creates a new pipeline with valid settings and repo path, and returns the pipeline ID."""
         mocker.patch.object(
             PipelinesApi,
@@ -273,33 +336,25 @@ class TestPipelineWrapper:
             return_value={"name": "pipeline1", "pipeline_id": "1234"},
         )
 
-        pipelines_wrapper = PipelinesWrapper(
-            api_client=mock_api_client, config_dir="./tests/data"
-        )
         pipeline_id = pipelines_wrapper.create_pipeline(
             {"name": "pipeline1"}, "/path/to/repo"
         )
         assert pipeline_id == "1234"
 
-    def test_update_pipeline(self, mocker, mock_api_client):
+    def test_update_pipeline(self, mocker, pipelines_wrapper):
         """Tests that the method updates an existing pipeline with valid settings and repo path, and returns the pipeline ID."""
         mocker.patch.object(PipelinesApi, "edit")
 
-        pipelines_wrapper = PipelinesWrapper(
-            api_client=mock_api_client, config_dir="./tests/data"
-        )
         pipeline_id = pipelines_wrapper.update_pipeline(
             {"id": "1234", "name": "pipeline1"}, "/path/to/repo"
         )
         assert pipeline_id == "1234"
 
-    def test_delete_pipeline_existing(self, mocker, mock_api_client):
+    def test_delete_pipeline_existing(self, mocker, pipelines_wrapper):
         """Tests that the method deletes an existing pipeline with a valid pipeline ID."""
         mock_delete = mocker.patch.object(PipelinesApi, "delete", return_value=None)
         mock_rm = mocker.patch.object(_FsUtil, "rm", return_value=None)
 
-        pipelines_wrapper = PipelinesWrapper(mock_api_client, "./tests/data")
-
         pipeline_id = "12345"
         pipelines_wrapper.delete_pipeline(pipeline_id)
 
@@ -10,7 +10,7 @@ from databricks_cli.workspace.api import WorkspaceApi
 from pushcart_deploy.databricks_api.repos_wrapper import ReposWrapper
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_api_client():
     api_client = ApiClient(host="https://databricks.sample.com")
 
@@ -2,21 +2,27 @@ import pytest
 from databricks_cli.repos.api import ReposApi
 from databricks_cli.sdk.api_client import ApiClient
 
-from pushcart_deploy.databricks_api import JobsWrapper, PipelinesWrapper, Scheduler
+from pushcart_deploy.databricks_api import JobsWrapper, Scheduler
 from pushcart_deploy.databricks_api.settings import JobSettings
 
+pytestmark = pytest.mark.xdist_group("scheduler")
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="module")
 def mock_api_client():
     api_client = ApiClient(host="https://databricks.sample.com")
 
     return api_client
 
 
+@pytest.fixture(scope="module")
+def scheduler(mock_api_client):
+    return Scheduler(api_client=mock_api_client, config_dir="./tests/data")
+
+
 class TestScheduler:
-    def test_get_obsolete_pipelines_list_happy(self, mock_api_client):
+    def test_get_obsolete_pipelines_list_happy(self, scheduler):
         """Tests that get_obsolete_pipelines_list returns the correct list."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         metadata_pipelines = [
             {"name": "pipeline1", "pipeline_id": "123"},
             {"name": "pipeline2", "pipeline_id": "456"},
@@ -33,9 +39,8 @@ class TestScheduler:
             == expected_result
         )
 
-    def test_get_matching_pipelines_list_happy(self, mock_api_client):
+    def test_get_matching_pipelines_list_happy(self, scheduler):
         """Tests that get_matching_pipelines_list returns the correct list."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         metadata_pipelines = [
             {
                 "target_catalog_name": "catalog1",
@@ -69,9 +74,8 @@ class TestScheduler:
             == expected_result
         )
 
-    def test_get_new_pipelines_list_edge(self, mock_api_client):
+    def test_get_new_pipelines_list_edge(self, scheduler):
         """Tests that get_new_pipelines_list handles an empty scheduled_pipelines list correctly."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         metadata_pipelines = [
             {"name": "pipeline1", "pipeline_id": "123"},
             {"name": "pipeline2", "pipeline_id": "456"},
@@ -83,16 +87,9 @@ class TestScheduler:
             == expected_result
         )
 
-    def test_create_or_update_pipelines_edge(self, mocker, mock_api_client):
+    def test_create_or_update_pipelines_edge(self, mocker, scheduler):
         """Tests that create_or_update_pipelines handles an empty metadata_pipelines list correctly."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
-
-        mocker.patch.object(ReposApi, "__init__", return_value=None)
-        mocker.patch.object(
-            ReposApi,
-            "get",
-            return_value={"id": "123", "path": "/Repos/pushcart/pushcart-config"},
-        )
+        get_repo = mocker.patch.object(ReposApi, "get")
 
         metadata_pipelines = []
         expected_result = []
@@ -100,10 +97,10 @@ class TestScheduler:
             scheduler.create_or_update_pipelines("123", metadata_pipelines)
             == expected_result
         )
+        get_repo.assert_not_called()
 
-    def test_create_or_update_jobs_general(self, mocker, mock_api_client):
+    def test_create_or_update_jobs_general(self, mocker, scheduler):
         """Tests that create_or_update_jobs creates or updates jobs correctly."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         pipelines = [
             {
                 "target_catalog_name": "sample_catalog",
@@ -132,9 +129,8 @@ class TestScheduler:
         create_job.assert_called_once()
         update_job.assert_called_once()
 
-    def test_delete_obsolete_pipelines_happy(self, mocker, mock_api_client):
+    def test_delete_obsolete_pipelines_happy(self, mocker, scheduler):
         """Tests that delete_obsolete_pipelines deletes pipelines correctly."""
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         obsolete_pipelines = [{"name": "pipeline1", "pipeline_id": "123"}]
         mocker.patch.object(scheduler.pipelines_wrapper, "delete_pipeline")
         scheduler.delete_obsolete_pipelines(obsolete_pipelines)
@@ -142,17 +138,30 @@ class TestScheduler:
             pipeline_id="123"
         )
 
-    def test_delete_obsolete_pipelines_edge(self, mocker, mock_api_client):
+    def test_delete_obsolete_pipelines_edge(self, mocker, scheduler):
         """Tests that delete_obsolete_pipelines handles an empty obsolete_pipelines list correctly."""
         delete_pipeline = mocker.patch.object(
-            PipelinesWrapper, "delete_pipeline", return_value=None
+            scheduler.pipelines_wrapper, "delete_pipeline", return_value=None
         )
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
-        scheduler.pipelines_wrapper = delete_pipeline
         scheduler.delete_obsolete_pipelines(obsolete_pipelines=[])
         delete_pipeline.assert_not_called()
 
-    def test_create_or_update_jobs_edge(self, mocker, mock_api_client):
+    def test_delete_obsolete_jobs_happy(self, mocker, scheduler):
+        """Tests that delete_obsolete_jobs deletes each job of an obsolete pipeline once."""
+        delete_job = mocker.patch.object(scheduler.jobs_wrapper, "delete_job")
+        obsolete_pipelines = [
+            {"name": "pipeline1", "pipeline_id": "123"},
+            {"name": "pipeline2", "pipeline_id": "456"},
+        ]
+        workflows_jobs = [
+            {"name": "pipeline1", "job_id": "1", "pipeline_id": "456"},
+            {"name": "job2", "job_id": "2", "pipeline_id": "123"},
+            {"name": "pipeline3", "job_id": "3", "pipeline_id": "789"},
+        ]
+        scheduler.delete_obsolete_jobs(obsolete_pipelines, workflows_jobs)
+        assert delete_job.call_args_list == [mocker.call("1"), mocker.call("2")]
+
+    def test_create_or_update_jobs_edge(self, mocker, scheduler):
         """Test that create_or_update_jobs handles an empty pipelines list correctly"""
         load_job_settings = mocker.patch.object(
             JobSettings, "load_job_settings", return_value={}
@@ -164,7 +173,6 @@ class TestScheduler:
             JobsWrapper, "update_job", return_value={"job_id": "123"}
         )
 
-        scheduler = Scheduler(api_client=mock_api_client, config_dir="./tests/data")
         scheduler.create_or_update_jobs(pipelines=[])
 
         load_job_settings.assert_not_called()
@@ -4,71 +4,85 @@ from databricks_cli.secrets.api import SecretApi
 
 from pushcart_deploy.databricks_api.secrets_wrapper import SecretsWrapper
 
+pytestmark = pytest.mark.xdist_group("secrets")
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="module")
 def mock_api_client():
     api_client = ApiClient(host="https://databricks.sample.com")
 
     return api_client
 
 
+@pytest.fixture(scope="module")
+def secrets_wrapper(mock_api_client):
+    mock_api_client.default_headers = {"Authorization": "Bearer test_token"}
+
+    return SecretsWrapper(mock_api_client)
+
+
+@pytest.fixture()
+def list_scopes(mocker):
+    return mocker.patch.object(
+        SecretApi,
+        "list_scopes",
+        return_value={"scopes": [{"name": "pushcart"}]},
+    )
+
+
+@pytest.fixture()
+def create_scope(mocker):
+    return mocker.patch.object(SecretApi, "create_scope")
+
+
+@pytest.fixture()
+def put_secret(mocker):
+    return mocker.patch.object(SecretApi, "put_secret")
+
+
 class TestSecretsWrapper:
-    def test_create_scope_if_not_exists_success(self, mocker, mock_api_client):
+    def test_create_scope_if_not_exists_success(
+        self, secrets_wrapper, list_scopes, create_scope
+    ):
         """Tests that create_scope_if_not_exists creates a new scope if it does not exist."""
-        mock_list_scopes = mocker.patch.object(
-            SecretApi, "list_scopes", return_value={"scopes": []}
-        )
-        mock_create_scope = mocker.patch.object(SecretApi, "create_scope")
-        secrets_wrapper = SecretsWrapper(mock_api_client)
+        list_scopes.return_value = {"scopes": []}
 
         secrets_wrapper.create_scope_if_not_exists("test_scope")
 
-        mock_list_scopes.assert_called_once()
-        mock_create_scope.assert_called_once_with(
+        list_scopes.assert_called_once()
+        create_scope.assert_called_once_with(
             initial_manage_principal="users",
             scope="test_scope",
             scope_backend_type="DATABRICKS",
             backend_azure_keyvault=None,
         )
 
-    def test_create_scope_if_not_exists_already_exists(self, mocker, mock_api_client):
+    def test_create_scope_if_not_exists_already_exists(
+        self, secrets_wrapper, list_scopes, create_scope
+    ):
         """Tests that create_scope_if_not_exists does not create a new scope if it already
         exists.
         """
-        mock_list_scopes = mocker.patch.object(SecretApi, "list_scopes")
-        mock_list_scopes.return_value = {"scopes": [{"name": "test_scope"}]}
-        mock_create_scope = mocker.patch.object(SecretApi, "create_scope")
-        secrets_wrapper = SecretsWrapper(mock_api_client)
+        list_scopes.return_value = {"scopes": [{"name": "test_scope"}]}
 
         secrets_wrapper.create_scope_if_not_exists("test_scope")
 
-        mock_list_scopes.assert_called_once()
-        mock_create_scope.assert_not_called()
+        list_scopes.assert_called_once()
+        create_scope.assert_not_called()
 
-    def test_push_secrets_empty_dict(self, mocker, mock_api_client):
+    def test_push_secrets_empty_dict(self, mocker, secrets_wrapper):
         """Tests that push_secrets does not push secrets if secrets_dict is empty."""
         mock_create_scope_if_not_exists = mocker.patch.object(
             SecretsWrapper,
             "create_scope_if_not_exists",
         )
-        secrets_wrapper = SecretsWrapper(mock_api_client)
 
         secrets_wrapper.push_secrets()
 
         mock_create_scope_if_not_exists.assert_not_called()
 
-    def test_push_secrets_success(self, mocker, mock_api_client):
+    def test_push_secrets_success(self, secrets_wrapper, list_scopes, put_secret):
         """Tests that push_secrets pushes secrets to an existing scope."""
-        mock_secrets_api_put_secret = mocker.patch.object(SecretApi, "put_secret")
-        mocker.patch.object(
-            SecretApi,
-            "list_scopes",
-            return_value={"scopes": [{"name": "pushcart"}]},
-        )
-
-        mock_api_client.default_headers = {"Authorization": "Bearer test_token"}
-        secrets_wrapper = SecretsWrapper(mock_api_client)
-
         secrets_dict = {"test_key": "test_value"}
         secret_scope_name = "pushcart"
 
@@ -77,23 +91,36 @@ class TestSecretsWrapper:
             secrets_dict=secrets_dict,
         )
 
-        mock_secrets_api_put_secret.assert_called_once_with(
+        put_secret.assert_called_once_with(
             secret_scope_name,
             "test_key",
             "test_value",
             bytes_value=None,
         )
 
-    def test_invalid_secret_scope_name(self, mocker, mock_api_client):
-        """Tests that an invalid secret_scope_name raises an error."""
-        mocker.patch.object(
-            SecretApi,
-            "list_scopes",
-            return_value={"scopes": [{"name": "pushcart"}]},
+    @pytest.mark.parametrize("num_secrets", [2, 20])
+    def test_push_secrets_many(
+        self, mocker, secrets_wrapper, list_scopes, put_secret, num_secrets
+    ):
+        """Tests that push_secrets puts every secret when pushing them concurrently."""
+        secrets_dict = {f"test_key_{i}": f"test_value_{i}" for i in range(num_secrets)}
+
+        secrets_wrapper.push_secrets(
+            secret_scope_name="pushcart",
+            secrets_dict=secrets_dict,
         )
-        mock_api_client.default_headers = {"Authorization": "Bearer test_token"}
-        secrets_wrapper = SecretsWrapper(mock_api_client)
 
+        put_secret.assert_has_calls(
+            [
+                mocker.call("pushcart", key, value, bytes_value=None)
+                for key, value in secrets_dict.items()
+            ],
+            any_order=True,
+        )
+        assert put_secret.call_count == num_secrets
+
+    def test_invalid_secret_scope_name(self, secrets_wrapper, list_scopes):
+        """Tests that an invalid secret_scope_name raises an error."""
         secrets_dict = {"test_key": "test_value"}
         secret_scope_name = "#invalid_scope_name"
 
@@ -103,16 +130,8 @@ class TestSecretsWrapper:
                 secrets_dict=secrets_dict,
             )
 
-    def test_invalid_key_or_value(self, mocker, mock_api_client):
+    def test_invalid_key_or_value(self, secrets_wrapper, list_scopes):
         """Test that an invalid key or value in secrets_dict raises an error."""
-        mocker.patch.object(
-            SecretApi,
-            "list_scopes",
-            return_value={"scopes": [{"name": "pushcart"}]},
-        )
-        mock_api_client.default_headers = {"Authorization": "Bearer test_token"}
-        secrets_wrapper = SecretsWrapper(mock_api_client)
-
         secrets_dict = {"#invalid_key": "test_value"}
         secret_scope_name = "pushcart"
 
@@ -10,29 +10,28 @@ from pushcart_deploy.validation import (
 
 
 class Test_IsEmpty:
-    def test_non_empty_string(self):
-        """Tests that a non-empty string returns False."""
-        assert not _is_empty("hello world")
-
-    def test_empty_string(self):
-        """Tests that an empty string returns True."""
-        assert _is_empty("")
-
-    def test_empty_dict(self):
-        """Tests that an empty dictionary returns True."""
-        assert _is_empty({})
-
-    def test_dict_with_only_boolean_or_integer_values(self):
-        """Tests that a dictionary with only boolean or integer values returns False."""
-        assert not _is_empty({"key1": True, "key2": False, "key3": 0, "key4": 1})
-
-    def test_empty_list(self):
-        """Tests that an empty list returns True."""
-        assert _is_empty([])
-
-    def test_list_with_only_boolean_or_integer_values(self):
-        """Tests that a list with only boolean or integer values returns False."""
-        assert not _is_empty([True, False, 0, 1])
+    @pytest.mark.parametrize(
+        ("obj", "expected"),
+        [
+            ("hello world", False),
+            ("", True),
+            ({}, True),
+            ({"key1": True, "key2": False, "key3": 0, "key4": 1}, False),
+            ([], True),
+            ([True, False, 0, 1], False),
+        ],
+        ids=[
+            "non_empty_string",
+            "empty_string",
+            "empty_dict",
+            "dict_with_only_boolean_or_integer_values",
+            "empty_list",
+            "list_with_only_boolean_or_integer_values",
+        ],
+    )
+    def test_is_empty(self, obj, expected):
+        """Tests that empty strings and containers are detected, and scalars are not."""
+        assert _is_empty(obj) is expected
 
 
 class Test_SanitizeObject:
@@ -63,88 +62,66 @@ class Test_SanitizeObject:
 
 
 class Test_SanitizeElementsInList:
-    def test_sanitize_elements_in_list_happy(self):
-        """Tests that the function correctly sanitizes a list with non-empty elements."""
-        input_list = [1, "hello", {"key": "value"}, True]
-        expected_output = [1, "hello", {"key": "value"}, True]
-        assert sanitize_list_elements(input_list) == expected_output
-
-    def test_sanitize_elements_in_list_empty(self):
-        """Tests that the function correctly sanitizes a list with empty elements."""
-        input_list = ["", {}, [], False]
-        expected_output = [None, None, None, False]
-        assert sanitize_list_elements(input_list) == expected_output
-
-    def test_sanitize_elements_in_list_only_none(self):
-        """Tests that the function correctly handles a list with only None elements."""
-        input_list = [None, None, None]
-        expected_output = [None, None, None]
-        assert sanitize_list_elements(input_list) == expected_output
-
-    def test_sanitize_elements_in_list_only_bool(self):
-        """Tests that the function correctly handles a list with only boolean elements."""
-        input_list = [True, False, True]
-        expected_output = [True, False, True]
-        assert sanitize_list_elements(input_list) == expected_output
-
-    def test_sanitize_elements_in_list_mixed(self):
-        """Tests that the function correctly sanitizes a list with mixed types of elements."""
-        input_list = ["", 0, {"key": "value"}, False]
-        expected_output = [None, 0, {"key": "value"}, False]
-        assert sanitize_list_elements(input_list) == expected_output
-
-    def test_sanitize_elements_in_list_empty_list(self):
-        """Tests that the function correctly handles an empty list."""
-        input_list = []
-        expected_output = []
+    @pytest.mark.parametrize(
+        ("input_list", "expected_output"),
+        [
+            ([1, "hello", {"key": "value"}, True], [1, "hello", {"key": "value"}, True]),
+            (["", {}, [], False], [None, None, None, False]),
+            ([None, None, None], [None, None, None]),
+            ([True, False, True], [True, False, True]),
+            (["", 0, {"key": "value"}, False], [None, 0, {"key": "value"}, False]),
+            ([], []),
+        ],
+        ids=["happy", "empty", "only_none", "only_bool", "mixed", "empty_list"],
+    )
+    def test_sanitize_elements_in_list(self, input_list, expected_output):
+        """Tests that empty list elements are replaced with None, and others are kept."""
         assert sanitize_list_elements(input_list) == expected_output
 
 
 class TestSantizeDictFields:
-    def test_sanitize_dict_fields_happy(self):
-        """Tests that a dictionary with non-empty values is sanitized correctly."""
-        input_dict = {"name": "John", "age": 30, "is_student": True}
-        expected_output = {"name": "John", "age": 30, "is_student": True}
-        assert sanitize_dict_fields(input_dict) == expected_output
-
-    def test_sanitize_dict_fields_empty(self):
-        """Tests that a dictionary with empty values is sanitized correctly."""
-        input_dict = {"name": "", "age": None, "is_student": False}
-        expected_output = {"name": None, "age": None, "is_student": False}
-        assert sanitize_dict_fields(input_dict) == expected_output
-
-    def test_sanitize_dict_fields_dots(self):
-        """Tests that keys containing dots are replaced with underscores."""
-        input_dict = {"first.name": "John", "last.name": "Doe"}
-        expected_output = {"first_name": "John", "last_name": "Doe"}
-        assert sanitize_dict_fields(input_dict) == expected_output
-
-    def test_sanitize_dict_fields_nonstring(self):
-        """Tests that keys containing non-string values are handled correctly."""
-        input_dict = {1: "one", 2: "two", 3: "three"}
-        expected_output = {"1": "one", "2": "two", "3": "three"}
-        assert sanitize_dict_fields(input_dict) == expected_output
-
-    def test_sanitize_dict_fields_types(self):
-        """Tests that values of different types (e.g. string, int, bool) are handled correctly."""
-        input_dict = {"name": "", "age": 30, "is_student": False}
-        expected_output = {"name": None, "age": 30, "is_student": False}
-        assert sanitize_dict_fields(input_dict) == expected_output
-
-    def test_sanitize_dict_fields_nested(self):
-        """Tests that a dictionary with nested dictionaries and lists is sanitized correctly."""
-        input_dict = {
-            "name": "John",
-            "age": 30,
-            "grades": [80, 90, 95],
-            "info": {"city": "New York", "state": "NY"},
-        }
-        expected_output = {
-            "name": "John",
-            "age": 30,
-            "grades": [80, 90, 95],
-            "info": {"city": "New York", "state": "NY"},
-        }
+    @pytest.mark.parametrize(
+        ("input_dict", "expected_output"),
+        [
+            (
+                {"name": "John", "age": 30, "is_student": True},
+                {"name": "John", "age": 30, "is_student": True},
+            ),
+            (
+                {"name": "", "age": None, "is_student": False},
+                {"name": None, "age": None, "is_student": False},
+            ),
+            (
+                {"first.name": "John", "last.name": "Doe"},
+                {"first_name": "John", "last_name": "Doe"},
+            ),
+            (
+                {1: "one", 2: "two", 3: "three"},
+                {"1": "one", "2": "two", "3": "three"},
+            ),
+            (
+                {"name": "", "age": 30, "is_student": False},
+                {"name": None, "age": 30, "is_student": False},
+            ),
+            (
+                {
+                    "name": "John",
+                    "age": 30,
+                    "grades": [80, 90, 95],
+                    "info": {"city": "New York", "state": "NY"},
+                },
+                {
+                    "name": "John",
+                    "age": 30,
+                    "grades": [80, 90, 95],
+                    "info": {"city": "New York", "state": "NY"},
+                },
+            ),
+        ],
+        ids=["happy", "empty", "dots", "nonstring", "types", "nested"],
+    )
+    def test_sanitize_dict_fields(self, input_dict, expected_output):
+        """Tests that dict fields are sanitized and their keys normalized."""
         assert sanitize_dict_fields(input_dict) == expected_output
 
 
@@ -177,7 +154,7 @@ class TestSanitizeEmptyObjects:
         input_obj = {"a": {"b": None}}
         input_obj["a"]["b"] = input_obj
 
-        with pytest.raises(RecursionError):
+        with pytest.raises(ValueError, match="reference to itself"):
             sanitize_empty_objects(input_obj)
 
     def test_drop_empty_false(self):
@@ -188,3 +165,18 @@ class TestSanitizeEmptyObjects:
 
     def test_input_none(self):
         assert sanitize_empty_objects(None) is None
+
+    def test_deeply_nested_input(self):
+        """Tests that nesting deeper than the interpreter recursion limit is sanitized."""
+        input_obj = inner = {}
+        for _ in range(5000):
+            inner["a"] = {"b": "", "c": "value"}
+            inner = inner["a"]
+
+        output = sanitize_empty_objects(input_obj, drop_empty=True)
+
+        depth = 0
+        while output := output.get("a"):
+            assert "b" not in output
+            depth += 1
+        assert depth == 5000